@@ -1,11 +1,20 @@
 from __future__ import annotations
 
-import uuid
+import itertools
+import os
 from collections.abc import Iterable
 from io import StringIO
 from pathlib import Path
 from typing import TextIO
 
+_MERGE_WRITE_BUFFER = 1 << 20
+
+_tmp_seq = itertools.count()
+
+
+def _tmp_suffix() -> str:
+    return f".{os.getpid()}_{next(_tmp_seq)}.tmp"
+
 
 def _normalize_newlines(text: str) -> str:
     if "\r" not in text:
@@ -29,13 +38,8 @@ def _iter_normalized_lines_for_merge(text: str) -> list[str]:
         # Drop the implicit last empty element created by split("\n") when text endswith "\n".
         lines.pop()
 
-    out: list[str] = []
-    for line in lines:
-        if line.strip() == "":
-            out.append("")
-        else:
-            out.append(line.rstrip())
-    return out
+    # rstrip() turns whitespace-only lines into "" as well, so one C-level call per line covers both cases.
+    return [line.rstrip() for line in lines]
 
 
 def merge_text_chunks(chunks: Iterable[tuple[str, bool]], writer: TextIO) -> None:
@@ -55,26 +59,30 @@ def merge_text_chunks(chunks: Iterable[tuple[str, bool]], writer: TextIO) -> Non
         keep_final_newline = chunk_text.endswith("\n") or chunk_text.endswith("\r")
         last_line_idx = len(lines) - 1
 
+        # Assemble the chunk in memory and hand it to the writer once.
+        parts: list[str] = []
         for j, line in enumerate(lines):
             if line == "":
-                writer.write("\n")
+                parts.append("\n")
                 prev_nonblank = False
                 continue
 
             if prev_nonblank:
-                writer.write("\n")
-            writer.write(line)
+                parts.append("\n")
+            parts.append(line)
             if not (is_last and not keep_final_newline and j == last_line_idx):
-                writer.write("\n")
+                parts.append("\n")
             prev_nonblank = True
+        writer.write("".join(parts))
 
 
 def merge_text_chunks_to_path(chunks: Iterable[tuple[str, bool]], out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = out_path.with_suffix(out_path.suffix + f".{uuid.uuid4().hex}.tmp")
-    with tmp.open("w", encoding="utf-8", newline="") as f:
+    tmp = out_path.with_suffix(out_path.suffix + _tmp_suffix())
+    # Large buffer: the merged novel is flushed in a few big writes rather than many 8 KiB ones.
+    with tmp.open("w", encoding="utf-8", newline="", buffering=_MERGE_WRITE_BUFFER) as f:
         merge_text_chunks(chunks, f)
-    tmp.replace(out_path)
+    os.replace(tmp, out_path)
 
 
 def merge_text_parts(parts: list[str]) -> str:
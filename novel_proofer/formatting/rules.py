@@ -67,25 +67,32 @@ def apply_rules(text: str, config: FormatConfig) -> tuple[str, dict[str, int]]:
         text = text.replace("\r\n", "\n").replace("\r", "\n")
         stats["normalize_newlines"] = stats.get("normalize_newlines", 0) + 1
 
-    if config.trim_trailing_spaces:
+    # Each regex pass below is guarded by a plain substring test for the characters it needs:
+    # `in` runs in C, while a regex scan with lookarounds is much slower on text it cannot match.
+    if config.trim_trailing_spaces and (" \n" in text or "\t\n" in text):
         text, n = _trailing_spaces_re.subn("", text)
         if n:
             stats["trim_trailing_spaces"] = stats.get("trim_trailing_spaces", 0) + n
 
-    if config.normalize_blank_lines:
+    if config.normalize_blank_lines and "\n\n\n" in text:
         text, n = _blank_lines_re.subn("\n\n", text)
         if n:
             stats["normalize_blank_lines"] = stats.get("normalize_blank_lines", 0) + n
 
     if config.normalize_ellipsis:
-        text, n1 = _ellipsis_ascii_re.subn("……", text)
-        text, n2 = _ellipsis_cn_re.subn("……", text)
-        text, n3 = _ellipsis_excess_re.subn("……", text)
-        n = n1 + n2 + n3
+        n = 0
+        if "..." in text:
+            text, k = _ellipsis_ascii_re.subn("……", text)
+            n += k
+        text, k = _ellipsis_cn_re.subn("……", text)
+        n += k
+        if "………" in text:
+            text, k = _ellipsis_excess_re.subn("……", text)
+            n += k
         if n:
             stats["normalize_ellipsis"] = stats.get("normalize_ellipsis", 0) + n
 
-    if config.normalize_em_dash:
+    if config.normalize_em_dash and ("——" in text or "--" in text or "-—" in text or "—-" in text):
         # Chinese em dash commonly uses '——' (two U+2014). Normalize common variants.
         text, n = _em_dash_re.subn("——", text)
         if n:
@@ -101,7 +108,7 @@ def apply_rules(text: str, config: FormatConfig) -> tuple[str, dict[str, int]]:
         if n:
             stats["fix_cjk_punct_spacing"] = stats.get("fix_cjk_punct_spacing", 0) + n
 
-    if config.normalize_quotes:
+    if config.normalize_quotes and '"' in text:
         text, n = _normalize_quotes(text)
         if n:
             stats["normalize_quotes"] = stats.get("normalize_quotes", 0) + n
@@ -134,6 +141,24 @@ _cjk_close_paren_re = re.compile(rf"(?<=[{_CJK}])\)")
 _cjk_space_before_punct_re = re.compile(rf"(?<=[{_CJK}])[ \t]+(?=[，。！？；：、,.!?;:])")
 _punct_space_before_cjk_re = re.compile(rf"(?<=[，。！？；：、,.!?;:])[ \t]+(?=[{_CJK}])")
 
+# (triggers, pattern, replacement) in application order; a pass only runs if one of its
+# trigger characters occurs in the text.
+_CJK_PUNCT_PASSES: tuple[tuple[str, re.Pattern[str], str], ...] = (
+    ("\uff0e\u3002", _num_fullwidth_dot_re, "."),
+    ("\uff0c", _num_fullwidth_comma_re, ","),
+    (",", _cjk_comma_after_re, "，"),
+    (",", _cjk_comma_before_re, "，"),
+    (";", _cjk_semicolon_re, "；"),
+    (":", _cjk_colon_re, "："),
+    ("?", _cjk_question_re, "？"),
+    ("!", _cjk_exclamation_re, "！"),
+    (".", _cjk_period_re, "。"),
+    ("(", _cjk_open_paren_after_re, "（"),
+    (")", _close_paren_before_cjk_re, "）"),
+    ("(", _open_paren_before_cjk_re, "（"),
+    (")", _cjk_close_paren_re, "）"),
+)
+
 
 def _normalize_cjk_punctuation(text: str) -> tuple[str, int]:
     """Convert common ASCII punctuation to fullwidth when in CJK context.
@@ -145,37 +170,10 @@ def _normalize_cjk_punctuation(text: str) -> tuple[str, int]:
 
     count = 0
 
-    text, n = _num_fullwidth_dot_re.subn(".", text)
-    count += n
-    text, n = _num_fullwidth_comma_re.subn(",", text)
-    count += n
-
-    text, n = _cjk_comma_after_re.subn("，", text)
-    count += n
-    text, n = _cjk_comma_before_re.subn("，", text)
-    count += n
-
-    text, n = _cjk_semicolon_re.subn("；", text)
-    count += n
-    text, n = _cjk_colon_re.subn("：", text)
-    count += n
-
-    text, n = _cjk_question_re.subn("？", text)
-    count += n
-    text, n = _cjk_exclamation_re.subn("！", text)
-    count += n
-
-    text, n = _cjk_period_re.subn("。", text)
-    count += n
-
-    text, n = _cjk_open_paren_after_re.subn("（", text)
-    count += n
-    text, n = _close_paren_before_cjk_re.subn("）", text)
-    count += n
-    text, n = _open_paren_before_cjk_re.subn("（", text)
-    count += n
-    text, n = _cjk_close_paren_re.subn("）", text)
-    count += n
+    for triggers, pattern, repl in _CJK_PUNCT_PASSES:
+        if any(ch in text for ch in triggers):
+            text, n = pattern.subn(repl, text)
+            count += n
 
     return text, count
 
@@ -184,6 +182,8 @@ def _fix_cjk_punct_spacing(text: str) -> tuple[str, int]:
     """Remove spaces between CJK characters and punctuation in CJK context."""
 
     count = 0
+    if " " not in text and "\t" not in text:
+        return text, count
 
     text, n = _cjk_space_before_punct_re.subn("", text)
     count += n
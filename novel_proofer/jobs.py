@@ -8,6 +8,7 @@ import re
 import threading
 import time
 import uuid
+from collections.abc import Iterable, Mapping
 from contextlib import suppress
 from dataclasses import asdict, dataclass, field, fields, replace
 from pathlib import Path
@@ -270,9 +271,17 @@ class JobStore:
         self._jobs: dict[str, JobStatus] = {}
         self._cancelled: set[str] = set()
         self._paused: set[str] = set()
+        # Lock-free cancel flags for hot polling paths (streaming should_stop, scheduler loop).
+        self._cancel_events: dict[str, threading.Event] = {}
         # In-memory store for pre-processed chunk texts to eliminate small file I/O.
         # Not persisted to disk; cleared per-chunk after LLM processing or when jobs are deleted.
         self._pre_texts: dict[str, dict[int, str]] = {}
+        # Chunks finished by the LLM since the last post-LLM rules pass (memory-only).
+        # A missing entry means "unknown" (e.g. after a restart) and callers must treat every chunk as pending.
+        self._post_pass_pending: dict[str, set[int]] = {}
+        # Chunks whose pre text came out of apply_rules unchanged (memory-only). If the LLM also
+        # returns that text verbatim, the post pass would be a no-op and the chunk is not queued for it.
+        self._rules_clean: dict[str, set[int]] = {}
         self._persist_dir: Path | None = None
         interval = (
             env_float("NOVEL_PROOFER_JOB_PERSIST_INTERVAL_S", 5.0)
@@ -660,6 +669,8 @@ class JobStore:
             ]
             st.chunk_counts = _new_chunk_counts()
             st.chunk_counts[ChunkState.PENDING] = total_chunks
+            # Fresh chunk list: nothing is done yet, so post-pass tracking starts out complete.
+            self._post_pass_pending[job_id] = set()
             self._mark_dirty_locked(job_id)
         self._flush_job(job_id, require_dirty=False)
 
@@ -668,38 +679,98 @@ class JobStore:
         if bad:
             raise ValueError(f"JobStore.update_chunk: unknown fields {bad}")
         with self._lock:
+            self._update_chunk_locked(job_id, index, kwargs)
+
+    def _update_chunk_locked(self, job_id: str, index: int, updates: dict) -> None:
+        st = self._jobs.get(job_id)
+        if st is None:
+            return
+        if st.state == JobState.CANCELLED or job_id in self._cancelled:
+            return
+        if index < 0 or index >= len(st.chunk_statuses):
+            return
+        cs = st.chunk_statuses[index]
+        prev_state = cs.state
+        should_persist = False
+        cs = replace(cs, **updates)
+        st.chunk_statuses[index] = cs
+        if "state" in updates and cs.state != prev_state:
+            should_persist = True
+            st.chunk_counts[prev_state] = max(0, st.chunk_counts.get(prev_state, 0) - 1)
+            st.chunk_counts[cs.state] = st.chunk_counts.get(cs.state, 0) + 1
+            if prev_state == ChunkState.DONE and st.done_chunks > 0:
+                st.done_chunks -= 1
+            if cs.state == ChunkState.DONE:
+                st.done_chunks += 1
+        if any(k in updates for k in ("retries", "last_error_code", "last_error_message")):
+            should_persist = True
+        if should_persist:
+            self._mark_dirty_locked(job_id)
+
+    def finish_chunk(self, job_id: str, index: int, *, stat_key: str, output_unchanged: bool = False, **kwargs) -> None:
+        """Apply a chunk's final update, bump `stat_key` and drop its pre text in one lock round-trip.
+
+        `output_unchanged` means the chunk output equals its pre text byte for byte.
+        """
+
+        bad = kwargs.keys() - _ALLOWED_CHUNK_UPDATE_FIELDS
+        if bad:
+            raise ValueError(f"JobStore.finish_chunk: unknown fields {bad}")
+        with self._lock:
+            self._update_chunk_locked(job_id, index, kwargs)
             st = self._jobs.get(job_id)
-            if st is None:
-                return
-            if st.state == JobState.CANCELLED or job_id in self._cancelled:
-                return
-            if index < 0 or index >= len(st.chunk_statuses):
+            if st is not None:
+                st.stats[stat_key] = st.stats.get(stat_key, 0) + 1
+                # Only extend an existing entry: a missing one means "unknown" and must stay that way.
+                pending = self._post_pass_pending.get(job_id)
+                clean = self._rules_clean.get(job_id)
+                skip = False
+                if clean is not None and int(index) in clean:
+                    clean.discard(int(index))
+                    skip = output_unchanged
+                if pending is not None and not skip:
+                    pending.add(int(index))
+            self._pop_chunk_pre_text_locked(job_id, index)
+
+    def get_post_pass_pending(self, job_id: str) -> set[int] | None:
+        """Return the chunks finished since the last post pass; None if not tracked."""
+
+        with self._lock:
+            pending = self._post_pass_pending.get(job_id)
+            return None if pending is None else set(pending)
+
+    def mark_post_pass_done(self, job_id: str, indices: Iterable[int]) -> None:
+        """Record a successful post pass over `indices`.
+
+        An untracked job becomes tracked: the pass that just succeeded covered every DONE chunk.
+        """
+
+        with self._lock:
+            if job_id not in self._jobs:
                 return
-            cs = st.chunk_statuses[index]
-            prev_state = cs.state
-            should_persist = False
-            cs = replace(cs, **kwargs)
-            st.chunk_statuses[index] = cs
-            if "state" in kwargs and cs.state != prev_state:
-                should_persist = True
-                st.chunk_counts[prev_state] = max(0, st.chunk_counts.get(prev_state, 0) - 1)
-                st.chunk_counts[cs.state] = st.chunk_counts.get(cs.state, 0) + 1
-                if prev_state == ChunkState.DONE and st.done_chunks > 0:
-                    st.done_chunks -= 1
-                if cs.state == ChunkState.DONE:
-                    st.done_chunks += 1
-            if any(k in kwargs for k in ("retries", "last_error_code", "last_error_message")):
-                should_persist = True
-            if should_persist:
-                self._mark_dirty_locked(job_id)
+            pending = self._post_pass_pending.get(job_id)
+            if pending is None:
+                self._post_pass_pending[job_id] = set()
+            else:
+                pending.difference_update(int(i) for i in indices)
 
     def add_retry(
-        self, job_id: str, index: int, inc: int, last_error_code: int | None, last_error_message: str | None
+        self,
+        job_id: str,
+        index: int,
+        inc: int,
+        last_error_code: int | None,
+        last_error_message: str | None,
+        *,
+        state: str | None = None,
     ) -> None:
         with self._lock:
             st = self._jobs.get(job_id)
             if st is None:
                 return
+            if state is not None:
+                # Lets retry callbacks move the chunk to RETRYING in the same critical section.
+                self._update_chunk_locked(job_id, index, {"state": state})
             st.last_retry_count += inc
             if last_error_code is not None:
                 st.last_error_code = last_error_code
@@ -718,6 +789,20 @@ class JobStore:
             st.stats[key] = st.stats.get(key, 0) + inc
         # Stats are best-effort diagnostics; avoid persisting on every increment for performance.
 
+    def add_stats(self, job_id: str, incs: Mapping[str, int], *, prefix: str = "") -> None:
+        """Add several stat increments in one lock round-trip (keys optionally prefixed)."""
+
+        if not incs:
+            return
+        with self._lock:
+            st = self._jobs.get(job_id)
+            if st is None:
+                return
+            stats = st.stats
+            for k, v in incs.items():
+                key = prefix + k
+                stats[key] = stats.get(key, 0) + v
+
     def cancel(self, job_id: str) -> bool:
         with self._lock:
             st = self._jobs.get(job_id)
@@ -727,6 +812,9 @@ class JobStore:
             now = time.time()
             self._cancelled.add(job_id)
             self._paused.discard(job_id)
+            evt = self._cancel_events.get(job_id)
+            if evt is not None:
+                evt.set()
 
             # Update visible state immediately so clients can stop polling.
             if st.state not in {JobState.DONE, JobState.ERROR}:
@@ -785,11 +873,14 @@ class JobStore:
                 existed = job_id in self._jobs
                 # Drop in-memory pre-texts, if any.
                 self._pre_texts.pop(job_id, None)
+                self._post_pass_pending.pop(job_id, None)
+                self._rules_clean.pop(job_id, None)
                 if existed:
                     path = self._persist_path_for_job_id(job_id)
                 self._jobs.pop(job_id, None)
                 self._cancelled.discard(job_id)
                 self._paused.discard(job_id)
+                self._cancel_events.pop(job_id, None)
                 self._persist_dirty_since.pop(job_id, None)
                 self._persist_seq.pop(job_id, None)
             if path is None:
@@ -805,25 +896,54 @@ class JobStore:
         with self._lock:
             return job_id in self._cancelled
 
+    def cancel_event(self, job_id: str) -> threading.Event:
+        """Return an Event that is set once the job is cancelled (cancellation is terminal)."""
+
+        with self._lock:
+            evt = self._cancel_events.get(job_id)
+            if evt is None:
+                evt = threading.Event()
+                if job_id in self._cancelled:
+                    evt.set()
+                if job_id in self._jobs:
+                    self._cancel_events[job_id] = evt
+            return evt
+
     # Pre-chunk text accessors (memory-only, thread-safe)
-    def set_chunk_pre_text(self, job_id: str, index: int, text: str) -> None:
+    def set_chunk_pre_text(self, job_id: str, index: int, text: str, *, rules_clean: bool = False) -> None:
+        """Store a chunk's pre text; `rules_clean` marks text that apply_rules left unchanged."""
+
         with self._lock:
             self._pre_texts.setdefault(job_id, {})[int(index)] = text
+            if rules_clean:
+                self._rules_clean.setdefault(job_id, set()).add(int(index))
+            else:
+                clean = self._rules_clean.get(job_id)
+                if clean is not None:
+                    clean.discard(int(index))
 
     def get_chunk_pre_text(self, job_id: str, index: int) -> str | None:
         with self._lock:
             d = self._pre_texts.get(job_id)
             return None if d is None else d.get(int(index))
 
-    def pop_chunk_pre_text(self, job_id: str, index: int) -> str | None:
+    def get_chunk_pre_text_lengths(self, job_id: str) -> dict[int, int]:
         with self._lock:
             d = self._pre_texts.get(job_id)
-            if not d:
-                return None
-            val = d.pop(int(index), None)
-            if not d:
-                self._pre_texts.pop(job_id, None)
-            return val
+            return {} if not d else {i: len(t) for i, t in d.items()}
+
+    def pop_chunk_pre_text(self, job_id: str, index: int) -> str | None:
+        with self._lock:
+            return self._pop_chunk_pre_text_locked(job_id, index)
+
+    def _pop_chunk_pre_text_locked(self, job_id: str, index: int) -> str | None:
+        d = self._pre_texts.get(job_id)
+        if not d:
+            return None
+        val = d.pop(int(index), None)
+        if not d:
+            self._pre_texts.pop(job_id, None)
+        return val
 
     def clear_all_pre_texts(self, job_id: str) -> None:
         with self._lock:
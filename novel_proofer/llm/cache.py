@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import os
+from contextlib import suppress
+from pathlib import Path
+
+from novel_proofer.llm.config import LLMConfig
+
+# Exact-match cache of validated chunk outputs, shared across jobs. Disabled unless
+# NOVEL_PROOFER_LLM_CACHE_DIR points at a directory.
+_CACHE_DIR_ENV = "NOVEL_PROOFER_LLM_CACHE_DIR"
+
+_tmp_seq = itertools.count()
+
+
+def _tmp_suffix() -> str:
+    return f".{os.getpid()}_{next(_tmp_seq)}.tmp"
+
+
+def response_cache_dir() -> Path | None:
+    raw = str(os.getenv(_CACHE_DIR_ENV, "") or "").strip()
+    if not raw:
+        return None
+    return Path(raw)
+
+
+def response_cache_key(cfg: LLMConfig, input_text: str) -> str:
+    """Hash everything that shapes the model output for *input_text*.
+
+    Endpoint/auth fields are left out: the same model behind a different key or proxy
+    should still hit.
+    """
+
+    h = hashlib.sha256()
+    for part in (
+        cfg.model,
+        repr(float(cfg.temperature)),
+        json.dumps(cfg.extra_params or {}, sort_keys=True, ensure_ascii=False),
+        cfg.system_prompt,
+        input_text,
+    ):
+        data = part.encode("utf-8")
+        h.update(len(data).to_bytes(8, "little"))
+        h.update(data)
+    return h.hexdigest()
+
+
+def _entry_path(cache_dir: Path, key: str) -> Path:
+    return cache_dir / key[:2] / f"{key}.txt"
+
+
+def load_cached_response(cache_dir: Path, key: str) -> str | None:
+    """Best-effort read; any unreadable entry or cache dir counts as a miss."""
+
+    try:
+        with _entry_path(cache_dir, key).open(encoding="utf-8", newline="") as f:
+            return f.read()
+    except (OSError, ValueError):
+        return None
+
+
+def discard_cached_response(cache_dir: Path, key: str) -> None:
+    with suppress(OSError):
+        _entry_path(cache_dir, key).unlink(missing_ok=True)
+
+
+def store_cached_response(cache_dir: Path, key: str, text: str) -> None:
+    """Best-effort write; concurrent writers of the same key race harmlessly via os.replace."""
+
+    p = _entry_path(cache_dir, key)
+    tmp = p.with_suffix(p.suffix + _tmp_suffix())
+    try:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(text, encoding="utf-8", newline="")
+        os.replace(tmp, p)
+    except OSError:
+        with suppress(OSError):
+            tmp.unlink(missing_ok=True)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import atexit
 import codecs
+import functools
 import ipaddress
 import json
 import logging
@@ -84,9 +85,19 @@ def _close_http_clients() -> None:
 atexit.register(_close_http_clients)
 
 
+@functools.lru_cache(maxsize=64)
+def _url_trusts_env(url: str) -> bool:
+    # Loopback endpoints bypass env proxies; parsed once per distinct URL.
+    return not _is_loopback_host(urllib.parse.urlparse(url).hostname)
+
+
+@functools.lru_cache(maxsize=64)
+def _chat_completions_url(base_url: str) -> str:
+    return base_url.rstrip("/") + "/chat/completions"
+
+
 def _httpx_client_for_url(url: str, *, max_connections: int) -> httpx.Client:
-    host = urllib.parse.urlparse(url).hostname
-    trust_env = not _is_loopback_host(host)
+    trust_env = _url_trusts_env(url)
 
     max_conn = max(1, int(max_connections))
     key = (trust_env, max_conn)
@@ -576,7 +587,7 @@ def _call_openai_compatible_with_raw(
         raise LLMError("LLM model is empty")
 
     logger.info("LLM request: model=%s streaming=true chars=%s", cfg.model, len(input_text))
-    url = cfg.base_url.rstrip("/") + "/chat/completions"
+    url = _chat_completions_url(cfg.base_url)
     payload: dict = {
         "model": cfg.model,
         "temperature": cfg.temperature,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, replace
 
 FIRST_CHUNK_SYSTEM_PROMPT_PREFIX = """\
@@ -69,6 +70,12 @@ class LLMConfig:
 只输出处理后的纯文本，不要任何解释。"""
 
 
+@functools.lru_cache(maxsize=8)
+def _first_chunk_system_prompt(system_prompt: str) -> str:
+    # Keyed by the prompt string: LLMConfig itself is unhashable when extra_params is set.
+    return FIRST_CHUNK_SYSTEM_PROMPT_PREFIX + "\n\n" + system_prompt
+
+
 def build_first_chunk_config(cfg: LLMConfig) -> LLMConfig:
     """Return a copy of *cfg* with the first-chunk system prompt prepended."""
-    return replace(cfg, system_prompt=FIRST_CHUNK_SYSTEM_PROMPT_PREFIX + "\n\n" + cfg.system_prompt)
+    return replace(cfg, system_prompt=_first_chunk_system_prompt(cfg.system_prompt))
@@ -3,9 +3,10 @@ from __future__ import annotations
 import concurrent.futures
 import itertools
 import os
+import re
 import shutil
 import time
-from collections import deque
+from collections import Counter, deque
 from contextlib import suppress
 from dataclasses import replace
 from pathlib import Path
@@ -16,6 +17,13 @@ from novel_proofer.formatting.config import FormatConfig, clamp_chunk_params
 from novel_proofer.formatting.merge import merge_text_chunks_to_path
 from novel_proofer.formatting.rules import apply_rules, is_chapter_title, is_separator_line
 from novel_proofer.jobs import GLOBAL_JOBS
+from novel_proofer.llm.cache import (
+    discard_cached_response,
+    load_cached_response,
+    response_cache_dir,
+    response_cache_key,
+    store_cached_response,
+)
 from novel_proofer.llm.client import LLMError, call_llm_text_resilient_with_meta_and_raw
 from novel_proofer.llm.config import LLMConfig, build_first_chunk_config
 from novel_proofer.states import ChunkState, JobPhase, JobState
@@ -37,6 +45,19 @@ def _ensure_job_debug_readme(work_dir: Path) -> None:
     _atomic_write_text(p, _JOB_DEBUG_README)
 
 
+def _leave_job_debug_readme(job_id: str) -> None:
+    """Best-effort README for a work dir that stops short of the merge cleanup (error/cancel)."""
+
+    st = GLOBAL_JOBS.get_summary(job_id)
+    if st is None or not st.work_dir:
+        return
+    work_dir = Path(st.work_dir)
+    if not work_dir.is_dir():
+        return
+    with suppress(OSError):
+        _ensure_job_debug_readme(work_dir)
+
+
 _tmp_seq = itertools.count()
 
 
@@ -44,17 +65,43 @@ def _tmp_suffix() -> str:
     return f".{os.getpid()}_{next(_tmp_seq)}.tmp"
 
 
-def _merge_stats(dst: dict[str, int], src: dict[str, int]) -> None:
-    for k, v in src.items():
-        dst[k] = dst.get(k, 0) + v
+_TMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
 
 
 def _atomic_write_text(path: Path, content: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
     # Use a unique temp name to avoid cross-thread collisions.
-    tmp = path.with_suffix(path.suffix + _tmp_suffix())
-    tmp.write_text(content, encoding="utf-8")
-    tmp.replace(path)
+    tmp = f"{path}{_tmp_suffix()}"
+    data = content.encode("utf-8")
+    try:
+        fd = os.open(tmp, _TMP_OPEN_FLAGS, 0o644)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp, _TMP_OPEN_FLAGS, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def _write_debug_text(path: Path, content: str) -> None:
+    """Plain (non-atomic) write for diagnostics nobody reads back, e.g. resp/.
+
+    A torn file after a crash only affects debugging and is overwritten by the next attempt.
+    """
+
+    try:
+        path.write_text(content, encoding="utf-8")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
 
 
 def _normalize_newlines(text: str) -> str:
@@ -63,42 +110,30 @@ def _normalize_newlines(text: str) -> str:
     return text.replace("\r\n", "\n").replace("\r", "\n")
 
 
+# Leading run of whitespace-only lines (each terminated by "\n"); `[^\S\n]` matches what str.strip() drops.
+_LEADING_BLANK_LINES_RE = re.compile(r"(?:[^\S\n]*\n)*")
+
+
 def _count_trailing_newlines(text: str) -> int:
-    n = 0
-    for ch in reversed(text):
-        if ch != "\n":
-            break
-        n += 1
-    return n
+    return len(text) - len(text.rstrip("\n"))
+
+
+def _leading_blank_span_norm(text: str) -> tuple[int, int]:
+    """Return (blank line count, end offset) of the leading blank run; `text` must be LF-normalized."""
+
+    m = _LEADING_BLANK_LINES_RE.match(text)
+    if m is None:
+        return 0, 0
+    return m.group(0).count("\n"), m.end()
 
 
 def _count_leading_blank_lines(text: str) -> int:
-    text = _normalize_newlines(text)
-    n = 0
-    i = 0
-    while True:
-        j = text.find("\n", i)
-        if j < 0:
-            break
-        line = text[i:j]
-        if line.strip() != "":
-            break
-        n += 1
-        i = j + 1
-    return n
+    return _leading_blank_span_norm(_normalize_newlines(text))[0]
 
 
 def _strip_leading_blank_lines(text: str) -> str:
     text = _normalize_newlines(text)
-    i = 0
-    while True:
-        j = text.find("\n", i)
-        if j < 0:
-            return text
-        line = text[i:j]
-        if line.strip() != "":
-            return text[i:]
-        i = j + 1
+    return text[_leading_blank_span_norm(text)[1] :]
 
 
 def _align_leading_blank_lines(reference: str, text: str, *, max_newlines: int = 10) -> str:
@@ -106,12 +141,11 @@ def _align_leading_blank_lines(reference: str, text: str, *, max_newlines: int =
 
     ref = _normalize_newlines(reference)
     out = _normalize_newlines(text)
-    want = min(_count_leading_blank_lines(ref), max_newlines)
-    have = _count_leading_blank_lines(out)
+    want = min(_leading_blank_span_norm(ref)[0], max_newlines)
+    have, end = _leading_blank_span_norm(out)
     if have == want:
         return out
-    base = _strip_leading_blank_lines(out)
-    return ("\n" * want) + base
+    return ("\n" * want) + out[end:]
 
 
 def _align_trailing_newlines(reference: str, text: str, *, max_newlines: int = 3) -> str:
@@ -124,13 +158,31 @@ def _align_trailing_newlines(reference: str, text: str, *, max_newlines: int = 3
     ref = _normalize_newlines(reference)
     out = _normalize_newlines(text)
     want = min(_count_trailing_newlines(ref), max_newlines)
-    have = _count_trailing_newlines(out)
-    if have == want:
-        return out
     base = out.rstrip("\n")
+    if len(out) - len(base) == want:
+        return out
     return base + ("\n" * want)
 
 
+def _align_edges(reference: str, text: str, *, max_leading: int = 10, max_trailing: int = 3) -> str:
+    """Equivalent to _align_trailing_newlines(reference, _align_leading_blank_lines(reference, text)).
+
+    Normalizes each string once instead of twice.
+    """
+
+    ref = _normalize_newlines(reference)
+    out = _normalize_newlines(text)
+    want = min(_leading_blank_span_norm(ref)[0], max_leading)
+    have, end = _leading_blank_span_norm(out)
+    if have != want:
+        out = ("\n" * want) + out[end:]
+    want = min(_count_trailing_newlines(ref), max_trailing)
+    base = out.rstrip("\n")
+    if len(out) - len(base) != want:
+        out = base + ("\n" * want)
+    return out
+
+
 def _best_effort_cleanup_work_dir(job_id: str, work_dir: Path) -> None:
     try:
         if work_dir.exists():
@@ -141,21 +193,46 @@ def _best_effort_cleanup_work_dir(job_id: str, work_dir: Path) -> None:
 
 
 def _should_cleanup_debug_dir(job_id: str) -> bool:
-    st = GLOBAL_JOBS.get(job_id)
+    st = GLOBAL_JOBS.get_summary(job_id)
     if st is None:
         return True
     return st.cleanup_debug_dir
 
 
-def _chunk_path(work_dir: Path, subdir: str, index: int) -> Path:
-    return work_dir / subdir / f"{index:06d}.txt"
+def _chunk_name(index: int) -> str:
+    return f"{index:06d}.txt"
+
+
+def _ensure_job_dirs(work_dir: Path) -> None:
+    # Created once per run so chunk writes don't pay an mkdir each.
+    for sub in ("pre", "out", "resp"):
+        (work_dir / sub).mkdir(parents=True, exist_ok=True)
+
+
+_MERGE_READ_AHEAD = 8
 
 
 def _merge_chunk_outputs(work_dir: Path, total_chunks: int, out_path: Path) -> None:
+    out_dir = work_dir / "out"
+
+    def _read(i: int) -> str:
+        return (out_dir / _chunk_name(i)).read_text(encoding="utf-8")
+
     def _iter_chunks():
-        for i in range(total_chunks):
-            p = _chunk_path(work_dir, "out", i)
-            yield (p.read_text(encoding="utf-8"), i == total_chunks - 1)
+        if total_chunks <= _MERGE_READ_AHEAD:
+            for i in range(total_chunks):
+                yield (_read(i), i == total_chunks - 1)
+            return
+        # Keep a bounded window of reads in flight; the merge still consumes chunks in index order.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as ex:
+            window = deque(ex.submit(_read, i) for i in range(_MERGE_READ_AHEAD))
+            next_i = _MERGE_READ_AHEAD
+            for i in range(total_chunks):
+                text = window.popleft().result()
+                if next_i < total_chunks:
+                    window.append(ex.submit(_read, next_i))
+                    next_i += 1
+                yield (text, i == total_chunks - 1)
 
     merge_text_chunks_to_path(_iter_chunks(), out_path)
 
@@ -165,73 +242,63 @@ def _post_merge_paragraph_indent_pass(out_path: Path, fmt: FormatConfig) -> None
         return
 
     indent = ("\u3000" * 2) if fmt.indent_with_fullwidth_space else "  "
-    tmp = out_path.with_suffix(out_path.suffix + _tmp_suffix())
 
+    # One read, one list build, one atomic write; the merged output fits in memory.
+    with out_path.open("r", encoding="utf-8", newline="") as src:
+        text = _normalize_newlines(src.read())
+
+    out_lines: list[str] = []
+    append = out_lines.append
     prev_blank = True
-    try:
-        with (
-            out_path.open("r", encoding="utf-8", newline="") as src,
-            tmp.open("w", encoding="utf-8", newline="") as dst,
-        ):
-            for raw in src:
-                has_nl = raw.endswith("\n")
-                line = raw[:-1] if has_nl else raw
-                if line.endswith("\r"):
-                    line = line[:-1]
-
-                if line.strip() == "":
-                    if has_nl:
-                        dst.write("\n")
-                    prev_blank = True
-                    continue
-
-                if is_chapter_title(line):
-                    dst.write(line.lstrip())
-                    if has_nl:
-                        dst.write("\n")
-                    prev_blank = False
-                    continue
-
-                if is_separator_line(line):
-                    dst.write(line)
-                    if has_nl:
-                        dst.write("\n")
-                    prev_blank = False
-                    continue
-
-                if prev_blank:
-                    if line.startswith(indent):
-                        out_line = line
-                    else:
-                        core = line.lstrip()
-                        out_line = (indent + core) if (core and len(core) >= 2) else core
-                else:
-                    out_line = line.lstrip()
-
-                dst.write(out_line)
-                if has_nl:
-                    dst.write("\n")
-                prev_blank = False
-        tmp.replace(out_path)
-    finally:
-        with suppress(Exception):
-            if tmp.exists():
-                tmp.unlink()
+    # split() leaves "" after a final "\n", so "\n".join() restores the trailing newline exactly.
+    for line in text.split("\n"):
+        if not line or line.isspace():
+            append("")
+            prev_blank = True
+            continue
+
+        if is_chapter_title(line):
+            append(line.lstrip())
+            prev_blank = False
+            continue
+
+        if is_separator_line(line):
+            append(line)
+            prev_blank = False
+            continue
+
+        if prev_blank:
+            if line.startswith(indent):
+                out_line = line
+            else:
+                core = line.lstrip()
+                out_line = (indent + core) if (core and len(core) >= 2) else core
+        else:
+            out_line = line.lstrip()
+
+        append(out_line)
+        prev_blank = False
+
+    _atomic_write_text(out_path, "\n".join(out_lines))
 
 
 def _finalize_processing(job_id: str, total: int, error_msg: str) -> bool:
     """Finalize job after PROCESS stage (no merge)."""
 
     if GLOBAL_JOBS.is_cancelled(job_id):
+        _leave_job_debug_readme(job_id)
         GLOBAL_JOBS.update(job_id, state=JobState.CANCELLED, finished_at=time.time())
         return False
 
-    cur = GLOBAL_JOBS.get(job_id)
+    cur = GLOBAL_JOBS.get_summary(job_id)
     if cur is None:
         return False
 
-    has_error = any(c.state == ChunkState.ERROR for c in cur.chunk_statuses)
+    # chunk_counts is maintained incrementally by the store; no need to copy/scan chunk_statuses.
+    has_error = cur.chunk_counts.get(ChunkState.ERROR, 0) > 0
     if has_error:
+        # The job may never be merged, so the debug dir can outlive it regardless of cleanup_debug_dir.
+        _leave_job_debug_readme(job_id)
         GLOBAL_JOBS.update(
             job_id,
             state=JobState.ERROR,
@@ -254,45 +321,68 @@ def _finalize_processing(job_id: str, total: int, error_msg: str) -> bool:
     return True
 
 
+def _apply_rules_to_file(p: Path, fmt: FormatConfig) -> dict[str, int]:
+    chunk_out = p.read_text(encoding="utf-8")
+    fixed, s = apply_rules(chunk_out, fmt)
+    if fixed != chunk_out:
+        _atomic_write_text(p, fixed)
+    return s
+
+
 def _post_llm_deterministic_pass(job_id: str, work_dir: Path) -> None:
     """Enforce local formatting invariants on per-chunk outputs (best-effort)."""
 
     st = GLOBAL_JOBS.get(job_id)
     if st is None:
         return
-    fmt = st.format
+    pre_fmt = replace(st.format, paragraph_indent=False)
+    out_dir = work_dir / "out"
+    cancel_evt = GLOBAL_JOBS.cancel_event(job_id)
+    # One directory listing instead of a stat() per chunk.
+    try:
+        with os.scandir(out_dir) as it:
+            present = {e.name for e in it}
+    except FileNotFoundError:
+        present = set()
+    # Chunks already post-processed by an earlier pass are unchanged since; only new outputs need the rules.
+    pending = GLOBAL_JOBS.get_post_pass_pending(job_id)
+    targets = [
+        out_dir / name
+        for cs in st.chunk_statuses
+        if cs.state == ChunkState.DONE
+        and (pending is None or cs.index in pending)
+        and (name := _chunk_name(cs.index)) in present
+    ]
 
-    post_stats: dict[str, int] = {}
-    for cs in st.chunk_statuses:
-        if GLOBAL_JOBS.is_cancelled(job_id):
-            return
-        if cs.state != ChunkState.DONE:
-            continue
-        p = _chunk_path(work_dir, "out", cs.index)
-        if not p.exists():
-            continue
-        chunk_out = p.read_text(encoding="utf-8")
-        pre_fmt = replace(fmt, paragraph_indent=False)
-        fixed, s = apply_rules(chunk_out, pre_fmt)
-        if fixed != chunk_out:
-            _atomic_write_text(p, fixed)
-        _merge_stats(post_stats, s)
+    def _process_one(p: Path) -> dict[str, int]:
+        if cancel_evt.is_set():
+            return {}
+        return _apply_rules_to_file(p, pre_fmt)
+
+    post_stats: Counter[str] = Counter()
+    # Chunks are independent; overlap their file I/O and fold stats on this thread.
+    workers = min(32, (os.cpu_count() or 4) + 4, max(1, len(targets)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+        for s in ex.map(_process_one, targets):
+            post_stats.update(s)
+    if cancel_evt.is_set():
+        return
 
-    for k, v in post_stats.items():
-        GLOBAL_JOBS.add_stat(job_id, f"post_{k}", v)
+    GLOBAL_JOBS.add_stats(job_id, post_stats, prefix="post_")
+    # Only forget the pending set once the pass has succeeded; an exception above keeps it for the next run.
+    GLOBAL_JOBS.mark_post_pass_done(job_id, pending if pending is not None else ())
 
 
 _MIN_VALIDATE_LEN = 200
 _SHORTEST_RATIO = 0.85
 _LONGEST_RATIO = 1.15
-_WORKER_WAIT_TIMEOUT_S = 0.5
 
 
 def _validate_llm_output(input_text: str, output_text: str, *, allow_shorter: bool = False) -> None:
     in_len = len(input_text)
     out_len = len(output_text)
-    out_trim = len(output_text.strip())
-    if in_len > 0 and out_trim == 0:
+    # Emptiness check without materializing a stripped copy of the output.
+    if in_len > 0 and (out_len == 0 or output_text.isspace()):
         raise LLMError(
             "LLM output empty",
             status_code=None,
@@ -312,19 +402,55 @@ def _validate_llm_output(input_text: str, output_text: str, *, allow_shorter: bo
 
 
 def _is_whitespace_only(text: str) -> bool:
-    return text.strip() == ""
+    return not text or text.isspace()
 
 
-def _llm_worker(job_id: str, index: int, work_dir: Path, llm: LLMConfig, *, write_llm_resp: bool) -> None:
-    if GLOBAL_JOBS.is_cancelled(job_id):
+def _finish_blank_chunk(job_id: str, index: int, out_path: Path, pre: str, llm_model: str) -> None:
+    # Whitespace-only chunks are valid (e.g., paragraph separators). Skip LLM entirely to
+    # avoid providers that emit no `content` for empty prompts.
+    _atomic_write_text(out_path, pre)
+    now = time.time()
+    GLOBAL_JOBS.finish_chunk(
+        job_id,
+        index,
+        stat_key="llm_skipped_blank_chunks",
+        output_unchanged=True,
+        state=ChunkState.DONE,
+        started_at=now,
+        finished_at=now,
+        last_error_code=None,
+        last_error_message=None,
+        llm_model=llm_model,
+        input_chars=len(pre),
+        output_chars=len(pre),
+    )
+
+
+def _llm_worker(
+    job_id: str,
+    index: int,
+    work_dir: Path,
+    llm: LLMConfig,
+    *,
+    write_llm_resp: bool,
+    cache_dir: Path | None = None,
+) -> None:
+    cancel_evt = GLOBAL_JOBS.cancel_event(job_id)
+    if cancel_evt.is_set():
         return
 
-    resp_path = _chunk_path(work_dir, "resp", index)
+    name = _chunk_name(index)
+    resp_path = work_dir / "resp" / name
+    out_path = work_dir / "out" / name
     raw_text: str | None = None
     try:
         pre = GLOBAL_JOBS.get_chunk_pre_text(job_id, index)
         if pre is None:
-            pre = _chunk_path(work_dir, "pre", index).read_text(encoding="utf-8")
+            pre = (work_dir / "pre" / name).read_text(encoding="utf-8")
+        if _is_whitespace_only(pre):
+            _finish_blank_chunk(job_id, index, out_path, pre, llm.model)
+            return
+
         GLOBAL_JOBS.update_chunk(
             job_id,
             index,
@@ -337,67 +463,77 @@ def _llm_worker(job_id: str, index: int, work_dir: Path, llm: LLMConfig, *, writ
             input_chars=len(pre),
             output_chars=None,
         )
-        # Whitespace-only chunks are valid (e.g., paragraph separators). Skip LLM entirely to
-        # avoid providers that emit no `content` for empty prompts.
-        if _is_whitespace_only(pre):
-            _atomic_write_text(_chunk_path(work_dir, "out", index), pre)
-            GLOBAL_JOBS.update_chunk(
-                job_id, index, state=ChunkState.DONE, finished_at=time.time(), output_chars=len(pre)
-            )
-            GLOBAL_JOBS.add_stat(job_id, "llm_skipped_blank_chunks", 1)
-            return
-
-        retry_count = 0
-
-        def on_retry(_retry_index: int, last_code: int | None, last_msg: str | None) -> None:
-            nonlocal retry_count
-            retry_count += 1
-            GLOBAL_JOBS.update_chunk(job_id, index, state=ChunkState.RETRYING)
-            GLOBAL_JOBS.add_retry(job_id, index, 1, last_code, last_msg)
-
-        def _should_stop() -> bool:
-            return GLOBAL_JOBS.is_cancelled(job_id)
 
         llm_cfg = llm
         if index == 0:
             llm_cfg = build_first_chunk_config(llm)
 
-        result, retries, last_code, last_msg = call_llm_text_resilient_with_meta_and_raw(
-            llm_cfg,
-            pre,
-            should_stop=_should_stop,
-            on_retry=on_retry,
-        )
-        raw_text = result.raw_text
-        filtered_text = result.text
+        cache_key: str | None = None
+        cached: str | None = None
+        if cache_dir is not None:
+            cache_key = response_cache_key(llm_cfg, pre)
+            cached = load_cached_response(cache_dir, cache_key)
+            if cached is not None:
+                # Only validated outputs are stored, but the entry may be stale or damaged. A rejected
+                # entry must not pin the chunk to ERROR across retries: drop it and ask the LLM instead.
+                try:
+                    _validate_llm_output(pre, cached, allow_shorter=(index == 0))
+                except LLMError:
+                    discard_cached_response(cache_dir, cache_key)
+                    cached = None
+        if cached is not None:
+            filtered_text = cached
+            stat_key = "llm_cache_hit_chunks"
+        else:
+            retry_count = 0
+
+            def on_retry(_retry_index: int, last_code: int | None, last_msg: str | None) -> None:
+                nonlocal retry_count
+                retry_count += 1
+                GLOBAL_JOBS.add_retry(job_id, index, 1, last_code, last_msg, state=ChunkState.RETRYING)
+
+            result, retries, last_code, last_msg = call_llm_text_resilient_with_meta_and_raw(
+                llm_cfg,
+                pre,
+                should_stop=cancel_evt.is_set,
+                on_retry=on_retry,
+            )
+            raw_text = result.raw_text
+            filtered_text = result.text
 
-        if retries > retry_count:
-            GLOBAL_JOBS.add_retry(job_id, index, retries - retry_count, last_code, last_msg)
+            if retries > retry_count:
+                GLOBAL_JOBS.add_retry(job_id, index, retries - retry_count, last_code, last_msg)
 
-        if GLOBAL_JOBS.is_cancelled(job_id):
-            return
+            if cancel_evt.is_set():
+                return
 
-        assert filtered_text is not None
+            assert filtered_text is not None
 
-        if write_llm_resp:
-            _atomic_write_text(resp_path, raw_text or "")
+            if write_llm_resp:
+                _write_debug_text(resp_path, raw_text or "")
 
-        _validate_llm_output(pre, filtered_text, allow_shorter=(index == 0))
+            _validate_llm_output(pre, filtered_text, allow_shorter=(index == 0))
+            if cache_dir is not None and cache_key is not None:
+                store_cached_response(cache_dir, cache_key, filtered_text)
+            stat_key = "llm_chunks"
 
-        final_text = _align_leading_blank_lines(pre, filtered_text)
-        final_text = _align_trailing_newlines(pre, final_text)
-        _atomic_write_text(_chunk_path(work_dir, "out", index), final_text)
-        GLOBAL_JOBS.update_chunk(
-            job_id, index, state=ChunkState.DONE, finished_at=time.time(), output_chars=len(final_text)
+        final_text = _align_edges(pre, filtered_text)
+        _atomic_write_text(out_path, final_text)
+        # Marks the chunk done and frees its pre text in one lock round-trip.
+        GLOBAL_JOBS.finish_chunk(
+            job_id,
+            index,
+            stat_key=stat_key,
+            output_unchanged=(final_text == pre),
+            state=ChunkState.DONE,
+            finished_at=time.time(),
+            output_chars=len(final_text),
         )
-        # Free pre text memory once processed.
-        GLOBAL_JOBS.pop_chunk_pre_text(job_id, index)
-        GLOBAL_JOBS.add_stat(job_id, "llm_chunks", 1)
     except LLMError as e:
-        if GLOBAL_JOBS.is_cancelled(job_id):
+        if cancel_evt.is_set():
             return
         if raw_text is not None:
-            _atomic_write_text(resp_path, raw_text or "")
+            _write_debug_text(resp_path, raw_text or "")
         GLOBAL_JOBS.update_chunk(
             job_id,
             index,
@@ -407,10 +543,10 @@ def _llm_worker(job_id: str, index: int, work_dir: Path, llm: LLMConfig, *, writ
             last_error_message=str(e),
         )
     except Exception as e:
-        if GLOBAL_JOBS.is_cancelled(job_id):
+        if cancel_evt.is_set():
             return
         if raw_text is not None:
-            _atomic_write_text(resp_path, raw_text or "")
+            _write_debug_text(resp_path, raw_text or "")
         GLOBAL_JOBS.update_chunk(
             job_id,
             index,
@@ -420,9 +556,23 @@ def _llm_worker(job_id: str, index: int, work_dir: Path, llm: LLMConfig, *, writ
         )
 
 
+def _longest_first(job_id: str, indices: list[int]) -> list[int]:
+    """Order chunks by pre text length, longest first.
+
+    Starting the slowest requests early keeps one long chunk from gating the tail of the run.
+    Chunks without an in-memory pre text keep their relative order at the end.
+    """
+
+    lengths = GLOBAL_JOBS.get_chunk_pre_text_lengths(job_id)
+    if not lengths:
+        return list(indices)
+    return sorted(indices, key=lambda i: -lengths.get(i, 0))
+
+
 def _run_llm_for_indices(job_id: str, indices: list[int], work_dir: Path, llm: LLMConfig) -> str:
     max_workers = max(1, int(llm.max_concurrency))
     write_llm_resp = env_truthy("NOVEL_PROOFER_LLM_WRITE_RESP")
+    cache_dir = response_cache_dir()
     if not write_llm_resp:
         st = GLOBAL_JOBS.get_summary(job_id)
         if st is not None and not st.cleanup_debug_dir:
@@ -437,13 +587,27 @@ def _run_llm_for_indices(job_id: str, indices: list[int], work_dir: Path, llm: L
         last_llm_model=llm.model,
     )
 
+    cancel_evt = GLOBAL_JOBS.cancel_event(job_id)
+
+    # Blank chunks are just a file copy: finish them here rather than spending a worker slot.
+    # Anything that fails (or has no in-memory pre text) goes through the worker, which records errors.
+    llm_indices: list[int] = []
+    for i in indices:
+        pre = None if cancel_evt.is_set() else GLOBAL_JOBS.get_chunk_pre_text(job_id, i)
+        if pre is not None and _is_whitespace_only(pre):
+            with suppress(Exception):
+                _finish_blank_chunk(job_id, i, work_dir / "out" / _chunk_name(i), pre, llm.model)
+                continue
+        llm_indices.append(i)
+
     with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
         # Submit gradually so cancel can actually stop launching new work.
-        pending_indices = deque(indices)
-        in_flight: dict[concurrent.futures.Future, int] = {}
+        # Stored reversed so the next index is a cheap pop() from the end.
+        pending_indices = _longest_first(job_id, llm_indices)[::-1]
+        in_flight: set[concurrent.futures.Future] = set()
 
         while pending_indices or in_flight:
-            if GLOBAL_JOBS.is_cancelled(job_id):
+            if cancel_evt.is_set():
                 break
             paused = GLOBAL_JOBS.is_paused(job_id)
             if paused and not in_flight:
@@ -454,33 +618,34 @@ def _run_llm_for_indices(job_id: str, indices: list[int], work_dir: Path, llm: L
                 while (
                     pending_indices
                     and len(in_flight) < max_workers
-                    and not GLOBAL_JOBS.is_cancelled(job_id)
+                    and not cancel_evt.is_set()
                     and not GLOBAL_JOBS.is_paused(job_id)
                 ):
-                    i = pending_indices.popleft()
-                    fut = ex.submit(_llm_worker, job_id, i, work_dir, llm, write_llm_resp=write_llm_resp)
-                    in_flight[fut] = i
+                    i = pending_indices.pop()
+                    fut = ex.submit(
+                        _llm_worker, job_id, i, work_dir, llm, write_llm_resp=write_llm_resp, cache_dir=cache_dir
+                    )
+                    in_flight.add(fut)
 
             if not in_flight:
                 break
 
-            done, _ = concurrent.futures.wait(
-                in_flight.keys(), timeout=_WORKER_WAIT_TIMEOUT_S, return_when=concurrent.futures.FIRST_COMPLETED
-            )
+            # Block until a worker finishes: a freed slot is the only event that lets us launch more
+            # work, and pause/cancel are re-checked right after. Workers observe cancel on their own.
+            done, in_flight = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
             for f in done:
-                in_flight.pop(f, None)
                 # Worker is responsible for updating chunk status.
                 with suppress(Exception):
                     f.result()
 
         # If cancelled, do not keep queued chunks as 'processing'.
-        if GLOBAL_JOBS.is_cancelled(job_id):
-            for i in pending_indices:
+        if cancel_evt.is_set():
+            for i in reversed(pending_indices):
                 GLOBAL_JOBS.update_chunk(job_id, i, state=ChunkState.PENDING)
             return "cancelled"
 
         if GLOBAL_JOBS.is_paused(job_id) and pending_indices:
-            for i in pending_indices:
+            for i in reversed(pending_indices):
                 GLOBAL_JOBS.update_chunk(job_id, i, state=ChunkState.PENDING)
             return "paused"
 
@@ -500,10 +665,11 @@ def run_job(job_id: str, input_path: Path, fmt: FormatConfig, llm: LLMConfig) ->
         return
 
     work_dir = Path(st.work_dir)
-    (work_dir / "pre").mkdir(parents=True, exist_ok=True)
-    (work_dir / "out").mkdir(parents=True, exist_ok=True)
-    (work_dir / "resp").mkdir(parents=True, exist_ok=True)
-    _ensure_job_debug_readme(work_dir)
+    _ensure_job_dirs(work_dir)
+    # The README only matters for kept debug dirs; merge writes it late if the flag flips,
+    # and error/cancel exits write it since they never reach the merge cleanup.
+    if not st.cleanup_debug_dir:
+        _ensure_job_debug_readme(work_dir)
 
     GLOBAL_JOBS.update(
         job_id,
@@ -522,17 +688,17 @@ def run_job(job_id: str, input_path: Path, fmt: FormatConfig, llm: LLMConfig) ->
             return
 
         max_chars, first_chunk_max_chars = clamp_chunk_params(fmt.max_chunk_chars)
-        local_stats: dict[str, int] = {}
+        local_stats: Counter[str] = Counter()
         total = 0
+        pre_fmt = replace(fmt, paragraph_indent=False)
+        chunks = iter_chunks_by_lines_with_first_chunk_max_from_file(
+            input_path,
+            max_chars=max_chars,
+            first_chunk_max_chars=first_chunk_max_chars,
+        )
         # For performance, skip writing per-chunk pre files; keep texts in memory and read them in workers.
         # Still create the pre/ directory for debuggability/tests.
-        for i, c in enumerate(
-            iter_chunks_by_lines_with_first_chunk_max_from_file(
-                input_path,
-                max_chars=max_chars,
-                first_chunk_max_chars=first_chunk_max_chars,
-            )
-        ):
+        for i, chunk in enumerate(chunks):
             if GLOBAL_JOBS.is_cancelled(job_id):
                 GLOBAL_JOBS.update(job_id, state=JobState.CANCELLED, finished_at=time.time())
                 return
@@ -540,16 +706,14 @@ def run_job(job_id: str, input_path: Path, fmt: FormatConfig, llm: LLMConfig) ->
                 GLOBAL_JOBS.update(job_id, state=JobState.PAUSED, phase=JobPhase.VALIDATE, finished_at=None)
                 return
 
-            pre_fmt = replace(fmt, paragraph_indent=False)
-            fixed, s = apply_rules(c, pre_fmt)
-            GLOBAL_JOBS.set_chunk_pre_text(job_id, i, fixed)
-            _merge_stats(local_stats, s)
+            fixed, s = apply_rules(chunk, pre_fmt)
+            GLOBAL_JOBS.set_chunk_pre_text(job_id, i, fixed, rules_clean=not s)
+            local_stats.update(s)
             total = i + 1
 
         GLOBAL_JOBS.init_chunks(job_id, total_chunks=total, llm_model=llm.model)
 
-        for k, v in local_stats.items():
-            GLOBAL_JOBS.add_stat(job_id, k, v)
+        GLOBAL_JOBS.add_stats(job_id, local_stats)
 
         if GLOBAL_JOBS.is_cancelled(job_id):
             GLOBAL_JOBS.update(job_id, state=JobState.CANCELLED, finished_at=time.time())
@@ -560,6 +724,7 @@ def run_job(job_id: str, input_path: Path, fmt: FormatConfig, llm: LLMConfig) ->
 
         GLOBAL_JOBS.update(job_id, state=JobState.PAUSED, phase=JobPhase.PROCESS, finished_at=None, error=None)
     except Exception as e:
+        _leave_job_debug_readme(job_id)
         if GLOBAL_JOBS.is_cancelled(job_id):
             GLOBAL_JOBS.update(job_id, state=JobState.CANCELLED, finished_at=time.time())
             return
@@ -579,7 +744,8 @@ def retry_failed_chunks(job_id: str, llm: LLMConfig) -> None:
         return
 
     work_dir = Path(st.work_dir)
-    _ensure_job_debug_readme(work_dir)
+    if not st.cleanup_debug_dir:
+        _ensure_job_debug_readme(work_dir)
 
     if not st.chunk_statuses:
         GLOBAL_JOBS.update(job_id, state=JobState.ERROR, finished_at=time.time(), error="job has no chunk statuses")
@@ -608,6 +774,7 @@ def retry_failed_chunks(job_id: str, llm: LLMConfig) -> None:
             output_chars=None,
         )
 
+    _ensure_job_dirs(work_dir)
     outcome = _run_llm_for_indices(job_id, targets, work_dir, llm)
     if outcome == "cancelled" or GLOBAL_JOBS.is_cancelled(job_id):
         GLOBAL_JOBS.update(job_id, state=JobState.CANCELLED, finished_at=time.time())
@@ -635,7 +802,8 @@ def resume_paused_job(job_id: str, llm: LLMConfig) -> None:
         return
 
     work_dir = Path(st.work_dir)
-    _ensure_job_debug_readme(work_dir)
+    if not st.cleanup_debug_dir:
+        _ensure_job_debug_readme(work_dir)
 
     total = len(st.chunk_statuses)
     pending = [c.index for c in st.chunk_statuses if c.state not in {ChunkState.DONE, ChunkState.ERROR}]
@@ -653,6 +821,7 @@ def resume_paused_job(job_id: str, llm: LLMConfig) -> None:
             llm_model=llm.model,
         )
 
+    _ensure_job_dirs(work_dir)
     outcome = _run_llm_for_indices(job_id, pending, work_dir, llm)
     if outcome == "cancelled" or GLOBAL_JOBS.is_cancelled(job_id):
         GLOBAL_JOBS.update(job_id, state=JobState.CANCELLED, finished_at=time.time())
@@ -666,7 +835,8 @@ def resume_paused_job(job_id: str, llm: LLMConfig) -> None:
 
 
 def merge_outputs(job_id: str, *, cleanup_debug_dir: bool | None = None) -> None:
-    st = GLOBAL_JOBS.get(job_id)
+    # Summary only: completeness is judged from the store's incremental chunk_counts.
+    st = GLOBAL_JOBS.get_summary(job_id)
     if st is None:
         return
     if st.state == JobState.CANCELLED or GLOBAL_JOBS.is_cancelled(job_id):
@@ -676,15 +846,15 @@ def merge_outputs(job_id: str, *, cleanup_debug_dir: bool | None = None) -> None
             job_id, state=JobState.ERROR, finished_at=time.time(), error="job missing work_dir/output_path"
         )
         return
-    if not st.chunk_statuses:
+    total = sum(st.chunk_counts.values())
+    if total <= 0:
         GLOBAL_JOBS.update(job_id, state=JobState.ERROR, finished_at=time.time(), error="job has no chunk statuses")
         return
 
     work_dir = Path(st.work_dir)
     out_path = Path(st.output_path)
-    total = len(st.chunk_statuses)
 
-    if any(c.state == ChunkState.ERROR for c in st.chunk_statuses):
+    if st.chunk_counts.get(ChunkState.ERROR, 0) > 0:
         GLOBAL_JOBS.update(
             job_id,
             state=JobState.ERROR,
@@ -693,7 +863,7 @@ def merge_outputs(job_id: str, *, cleanup_debug_dir: bool | None = None) -> None
             error="cannot merge: chunks failed",
         )
         return
-    if any(c.state != ChunkState.DONE for c in st.chunk_statuses):
+    if st.chunk_counts.get(ChunkState.DONE, 0) != total:
         GLOBAL_JOBS.update(
             job_id,
             state=JobState.ERROR,
@@ -712,8 +882,10 @@ def merge_outputs(job_id: str, *, cleanup_debug_dir: bool | None = None) -> None
         if do_cleanup:
             _best_effort_cleanup_work_dir(job_id, work_dir)
         else:
+            _ensure_job_debug_readme(work_dir)
             GLOBAL_JOBS.add_stat(job_id, "cleanup_work_dir_skipped", 1)
     except Exception as e:
+        _leave_job_debug_readme(job_id)
         if GLOBAL_JOBS.is_cancelled(job_id):
             GLOBAL_JOBS.update(job_id, state=JobState.CANCELLED, finished_at=time.time())
             return
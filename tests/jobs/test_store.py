@@ -105,6 +105,13 @@ def test_job_store_add_retry_updates_job_and_chunk() -> None:
     assert got2.last_retry_count == 3
     assert got2.last_error_code == 500
 
+    js.add_retry(job_id, 0, 1, 503, "busy", state="retrying")
+    got3 = js.get(job_id)
+    assert got3 is not None
+    assert got3.chunk_statuses[0].state == "retrying"
+    assert got3.chunk_statuses[0].retries == 3
+    assert got3.chunk_counts.get("retrying", 0) == 1
+
 
 def test_job_store_cancel_resets_processing_chunks() -> None:
     js = JobStore()
@@ -200,3 +207,93 @@ def test_job_store_persistence_is_throttled_and_flushable(tmp_path: Path) -> Non
         assert calls == 1
     finally:
         js.shutdown_persistence(wait=True)
+
+
+def test_job_store_finish_chunk_updates_stats_and_pre_text() -> None:
+    js = JobStore()
+    st = js.create("in.txt", "out.txt", total_chunks=2)
+    job_id = st.job_id
+    js.init_chunks(job_id, total_chunks=2)
+    js.set_chunk_pre_text(job_id, 0, "a")
+    js.set_chunk_pre_text(job_id, 1, "b")
+
+    js.finish_chunk(job_id, 0, stat_key="llm_chunks", state="done", output_chars=1)
+    got = js.get(job_id)
+    assert got is not None
+    assert got.done_chunks == 1
+    assert got.chunk_statuses[0].output_chars == 1
+    assert got.stats["llm_chunks"] == 1
+    assert js.get_chunk_pre_text(job_id, 0) is None
+    assert js.get_chunk_pre_text(job_id, 1) == "b"
+
+    js.finish_chunk("missing", 0, stat_key="llm_chunks", state="done")
+
+
+def test_job_store_cancel_event_tracks_cancellation() -> None:
+    js = JobStore()
+    job_id = js.create("in.txt", "out.txt", total_chunks=0).job_id
+
+    evt = js.cancel_event(job_id)
+    assert evt.is_set() is False
+    assert js.cancel_event(job_id) is evt
+
+    assert js.cancel(job_id) is True
+    assert evt.is_set() is True
+
+    assert js.cancel_event("missing").is_set() is False
+
+
+def test_job_store_add_stats_bulk() -> None:
+    js = JobStore()
+    job_id = js.create("in.txt", "out.txt", total_chunks=0).job_id
+
+    js.add_stat(job_id, "post_a", 1)
+    js.add_stats(job_id, {"a": 2, "b": 3}, prefix="post_")
+    js.add_stats(job_id, {})
+    js.add_stats("missing", {"a": 1})
+    got = js.get(job_id)
+    assert got is not None
+    assert got.stats == {"post_a": 3, "post_b": 3}
+
+
+def test_job_store_tracks_chunks_pending_post_pass() -> None:
+    js = JobStore()
+    job_id = js.create("in.txt", "out.txt", total_chunks=3).job_id
+
+    # Untracked (e.g. after restart) -> None means "process everything", and finishing chunks keeps it so.
+    assert js.get_post_pass_pending(job_id) is None
+    js.finish_chunk(job_id, 1, stat_key="llm_chunks", state="done")
+    assert js.get_post_pass_pending(job_id) is None
+    js.mark_post_pass_done(job_id, ())
+    assert js.get_post_pass_pending(job_id) == set()
+
+    js.init_chunks(job_id, total_chunks=3)
+    assert js.get_post_pass_pending(job_id) == set()
+
+    js.finish_chunk(job_id, 0, stat_key="llm_chunks", state="done")
+    js.finish_chunk(job_id, 2, stat_key="llm_chunks", state="done")
+    # Reading does not clear: a pass that fails must see the same chunks next time.
+    assert js.get_post_pass_pending(job_id) == {0, 2}
+    assert js.get_post_pass_pending(job_id) == {0, 2}
+
+    js.mark_post_pass_done(job_id, {0})
+    assert js.get_post_pass_pending(job_id) == {2}
+    js.mark_post_pass_done(job_id, {2})
+    assert js.get_post_pass_pending(job_id) == set()
+
+
+def test_job_store_skips_post_pass_for_unchanged_rules_clean_chunks() -> None:
+    js = JobStore()
+    job_id = js.create("in.txt", "out.txt", total_chunks=4).job_id
+    js.init_chunks(job_id, total_chunks=4)
+    js.set_chunk_pre_text(job_id, 0, "a", rules_clean=True)
+    js.set_chunk_pre_text(job_id, 1, "b", rules_clean=True)
+    js.set_chunk_pre_text(job_id, 2, "c")
+    js.set_chunk_pre_text(job_id, 3, "d", rules_clean=True)
+    js.set_chunk_pre_text(job_id, 3, "d2")
+
+    js.finish_chunk(job_id, 0, stat_key="llm_chunks", output_unchanged=True, state="done")
+    js.finish_chunk(job_id, 1, stat_key="llm_chunks", state="done")
+    js.finish_chunk(job_id, 2, stat_key="llm_chunks", output_unchanged=True, state="done")
+    js.finish_chunk(job_id, 3, stat_key="llm_chunks", output_unchanged=True, state="done")
+    assert js.get_post_pass_pending(job_id) == {1, 2, 3}
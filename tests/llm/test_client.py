@@ -7,7 +7,7 @@ import pytest
 
 from novel_proofer.llm import client as llm_client
 from novel_proofer.llm.client import LLMError
-from novel_proofer.llm.config import LLMConfig
+from novel_proofer.llm.config import FIRST_CHUNK_SYSTEM_PROMPT_PREFIX, LLMConfig, build_first_chunk_config
 
 
 class _FakeStreamResponse:
@@ -411,3 +411,12 @@ def test_call_llm_text_resilient_with_meta_and_raw_non_retryable_raises(monkeypa
     with pytest.raises(LLMError, match=r"HTTP 401"):
         llm_client.call_llm_text_resilient_with_meta_and_raw(cfg, "x")
     assert sleeps == []
+
+
+def test_build_first_chunk_config_reuses_prompt_for_unhashable_config():
+    cfg = LLMConfig(system_prompt="P", extra_params={"thinking": {"type": "disabled"}})
+    a = build_first_chunk_config(cfg)
+    b = build_first_chunk_config(cfg)
+    assert a.system_prompt == FIRST_CHUNK_SYSTEM_PROMPT_PREFIX + "\n\nP"
+    assert a.system_prompt is b.system_prompt
+    assert a.extra_params == cfg.extra_params
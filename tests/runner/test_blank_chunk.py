@@ -3,7 +3,11 @@ from __future__ import annotations
 import tempfile
 from pathlib import Path
 
+import pytest
+
+import novel_proofer.runner as runner
 from novel_proofer.jobs import GLOBAL_JOBS
+from novel_proofer.llm.client import LLMTextResult
 from novel_proofer.llm.config import LLMConfig
 from novel_proofer.runner import _llm_worker
 
@@ -40,3 +44,44 @@ def test_llm_worker_skips_whitespace_only_chunk() -> None:
             assert st.chunk_statuses[0].output_chars == len(pre)
         finally:
             GLOBAL_JOBS.delete(job_id)
+
+
+def test_run_llm_for_indices_finishes_blank_chunks_without_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    sent: list[str] = []
+    worker_indices: list[int] = []
+    real_worker = runner._llm_worker
+
+    def fake_call(cfg: LLMConfig, input_text: str, *, should_stop=None, on_retry=None):
+        sent.append(input_text)
+        return LLMTextResult(text=input_text, raw_text="RAW"), 0, None, None
+
+    def spy_worker(job_id: str, index: int, *args, **kwargs) -> None:
+        worker_indices.append(index)
+        real_worker(job_id, index, *args, **kwargs)
+
+    monkeypatch.setattr(runner, "call_llm_text_resilient_with_meta_and_raw", fake_call)
+    monkeypatch.setattr(runner, "_llm_worker", spy_worker)
+
+    with tempfile.TemporaryDirectory() as td:
+        work_dir = Path(td)
+        job = GLOBAL_JOBS.create("in.txt", "out.txt", total_chunks=3)
+        job_id = job.job_id
+        try:
+            GLOBAL_JOBS.init_chunks(job_id, total_chunks=3)
+            for i, text in enumerate(["A\n", "\n\n", "B\n"]):
+                GLOBAL_JOBS.set_chunk_pre_text(job_id, i, text)
+            runner._ensure_job_dirs(work_dir)
+
+            cfg = LLMConfig(base_url="http://example.com", model="m", max_concurrency=1)
+            assert runner._run_llm_for_indices(job_id, [0, 1, 2], work_dir, cfg) == "done"
+
+            assert sorted(worker_indices) == [0, 2]
+            assert sorted(sent) == ["A\n", "B\n"]
+            assert (work_dir / "out" / "000001.txt").read_text(encoding="utf-8") == "\n\n"
+            st = GLOBAL_JOBS.get(job_id)
+            assert st is not None
+            assert st.done_chunks == 3
+            assert st.chunk_statuses[1].input_chars == 2
+            assert st.stats.get("llm_skipped_blank_chunks") == 1
+        finally:
+            GLOBAL_JOBS.delete(job_id)
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
+import novel_proofer.runner as runner
 from novel_proofer.runner import _align_leading_blank_lines, _align_trailing_newlines, _merge_chunk_outputs
 
 
@@ -23,6 +26,14 @@ def test_align_leading_blank_lines_treats_whitespace_lines_as_blank() -> None:
     assert _align_leading_blank_lines(pre, llm) == "\n\n第1章\n"
 
 
+def test_align_leading_blank_lines_strips_blank_run_before_unterminated_last_line() -> None:
+    # The blank run is removed even when the non-blank line after it has no trailing newline.
+    assert _align_leading_blank_lines("第1章\n", "\n\n第1章") == "第1章"
+    assert _align_leading_blank_lines("\n第1章\n", "\n\n\n第1章") == "\n第1章"
+    assert runner._strip_leading_blank_lines("\n \n第1章") == "第1章"
+    assert runner._count_leading_blank_lines("\n \n第1章") == 2
+
+
 def test_align_trailing_newlines_restores_missing_blank_line() -> None:
     pre = "上一段落。\n\n"
     llm = "上一段落。\n"
@@ -47,6 +58,20 @@ def test_align_trailing_newlines_normalizes_crlf() -> None:
     assert _align_trailing_newlines(pre, llm) == "上一段落。\n\n"
 
 
+@pytest.mark.parametrize(
+    ("pre", "llm"),
+    [
+        ("\n\n第1章\n\n", "第1章\r\n"),
+        ("第1章\n", "\n \n第1章\n\n\n\n"),
+        ("\n\n", "\n"),
+        ("", "\n\nx"),
+    ],
+)
+def test_align_edges_matches_separate_alignment(pre: str, llm: str) -> None:
+    expected = _align_trailing_newlines(pre, _align_leading_blank_lines(pre, llm))
+    assert runner._align_edges(pre, llm) == expected
+
+
 def test_merge_chunk_outputs_inserts_blank_line_between_chunks(tmp_path: Path) -> None:
     work_dir = tmp_path / "job"
     (work_dir / "out").mkdir(parents=True, exist_ok=True)
@@ -72,3 +97,25 @@ def test_merge_chunk_outputs_inserts_blank_line_within_single_chunk(tmp_path: Pa
     _merge_chunk_outputs(work_dir, total_chunks=1, out_path=out_path)
 
     assert out_path.read_text(encoding="utf-8") == "　　A\n\n　　B\n"
+
+
+def test_merge_chunk_outputs_read_ahead_keeps_order(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    work_dir = tmp_path / "job"
+    (work_dir / "out").mkdir(parents=True, exist_ok=True)
+    for i in range(5):
+        (work_dir / "out" / f"{i:06d}.txt").write_text(f"　　段{i}。\n", encoding="utf-8")
+
+    monkeypatch.setattr(runner, "_MERGE_READ_AHEAD", 2)
+    out_path = tmp_path / "merged.txt"
+    _merge_chunk_outputs(work_dir, total_chunks=5, out_path=out_path)
+
+    assert out_path.read_text(encoding="utf-8") == "\n\n".join(f"　　段{i}。" for i in range(5)) + "\n"
+
+
+def test_leading_blank_line_helpers_treat_whitespace_only_lines_as_blank() -> None:
+    text = " \t\n　\n\nX\n\n"
+    assert runner._count_leading_blank_lines(text) == 3
+    assert runner._strip_leading_blank_lines(text) == "X\n\n"
+    assert runner._count_leading_blank_lines("　X\n") == 0
+    assert runner._count_leading_blank_lines("  ") == 0
+    assert runner._count_trailing_newlines("a\n\n") == 2
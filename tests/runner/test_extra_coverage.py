@@ -442,3 +442,192 @@ def test_retry_failed_and_resume_paused_branches(monkeypatch: pytest.MonkeyPatch
             assert getattr(st, "phase", None) == "merge"
         finally:
             GLOBAL_JOBS.delete(job6_id)
+
+
+def test_atomic_write_text_creates_parent_and_replaces() -> None:
+    with tempfile.TemporaryDirectory() as td:
+        p = Path(td) / "out" / "000000.txt"
+        runner._atomic_write_text(p, "第1章\n\n你好\n")
+        assert p.read_bytes() == "第1章\n\n你好\n".encode()
+
+        runner._atomic_write_text(p, "x")
+        assert p.read_bytes() == b"x"
+        assert sorted(x.name for x in p.parent.iterdir()) == ["000000.txt"]
+
+
+def test_atomic_write_text_overwrites_stale_temp_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    # A temp file left behind by an earlier process with the same pid must not block the write.
+    monkeypatch.setattr(runner, "_tmp_suffix", lambda: ".1_0.tmp")
+    with tempfile.TemporaryDirectory() as td:
+        p = Path(td) / "000000.txt"
+        Path(f"{p}.1_0.tmp").write_bytes(b"stale leftover content")
+        runner._atomic_write_text(p, "ok")
+        assert p.read_bytes() == b"ok"
+        assert sorted(x.name for x in p.parent.iterdir()) == ["000000.txt"]
+
+
+def test_longest_first_orders_by_pre_text_length() -> None:
+    job_id = GLOBAL_JOBS.create("in.txt", "out.txt", total_chunks=4).job_id
+    try:
+        assert runner._longest_first(job_id, [0, 1, 2, 3]) == [0, 1, 2, 3]
+        GLOBAL_JOBS.set_chunk_pre_text(job_id, 0, "aa")
+        GLOBAL_JOBS.set_chunk_pre_text(job_id, 1, "a")
+        GLOBAL_JOBS.set_chunk_pre_text(job_id, 2, "aaaa")
+        assert runner._longest_first(job_id, [0, 1, 2, 3]) == [2, 0, 1, 3]
+    finally:
+        GLOBAL_JOBS.delete(job_id)
+
+
+def test_post_llm_pass_applies_rules_to_done_chunks() -> None:
+    texts = [f"他说:你好...  \n第{i}段。\n" for i in range(4)]
+    fmt = runner.FormatConfig(paragraph_indent=False)
+    expected = [runner.apply_rules(t, fmt) for t in texts]
+
+    with tempfile.TemporaryDirectory() as td:
+        work_dir = Path(td)
+        (work_dir / "out").mkdir(parents=True)
+        for i, t in enumerate(texts):
+            (work_dir / "out" / f"{i:06d}.txt").write_text(t, encoding="utf-8")
+        job_id = _mk_job(work_dir, work_dir / "o.txt", total_chunks=len(texts))
+        try:
+            GLOBAL_JOBS.update(job_id, format=fmt)
+            for i in range(len(texts)):
+                GLOBAL_JOBS.finish_chunk(job_id, i, stat_key="llm_chunks", state="done")
+            runner._post_llm_deterministic_pass(job_id, work_dir)
+            st = GLOBAL_JOBS.get(job_id)
+            assert st is not None
+            outs = [(work_dir / "out" / f"{i:06d}.txt").read_text(encoding="utf-8") for i in range(len(texts))]
+            assert outs == [fixed for fixed, _ in expected]
+            for key, n in expected[0][1].items():
+                assert st.stats[f"post_{key}"] == n * len(texts)
+        finally:
+            GLOBAL_JOBS.delete(job_id)
+
+
+def test_post_llm_pass_keeps_pending_chunks_when_pass_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    with tempfile.TemporaryDirectory() as td:
+        work_dir = Path(td)
+        (work_dir / "out").mkdir(parents=True)
+        for i in range(2):
+            (work_dir / "out" / f"{i:06d}.txt").write_text("x\n", encoding="utf-8")
+        job_id = _mk_job(work_dir, work_dir / "o.txt", total_chunks=2)
+        try:
+            GLOBAL_JOBS.init_chunks(job_id, total_chunks=2)
+            for i in range(2):
+                GLOBAL_JOBS.finish_chunk(job_id, i, stat_key="llm_chunks", state="done")
+
+            def boom(_p: Path, _fmt: runner.FormatConfig) -> dict[str, int]:
+                raise OSError("disk full")
+
+            monkeypatch.setattr(runner, "_apply_rules_to_file", boom)
+            with pytest.raises(OSError):
+                runner._post_llm_deterministic_pass(job_id, work_dir)
+            assert GLOBAL_JOBS.get_post_pass_pending(job_id) == {0, 1}
+
+            monkeypatch.undo()
+            runner._post_llm_deterministic_pass(job_id, work_dir)
+            assert GLOBAL_JOBS.get_post_pass_pending(job_id) == set()
+        finally:
+            GLOBAL_JOBS.delete(job_id)
+
+
+def test_llm_worker_response_cache_skips_repeat_calls(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def fake_call(cfg: LLMConfig, input_text: str, *, should_stop=None, on_retry=None):
+        calls.append(input_text)
+        return LLMTextResult(text="OUT\n", raw_text="RAW"), 0, None, None
+
+    monkeypatch.setattr(runner, "call_llm_text_resilient_with_meta_and_raw", fake_call)
+
+    with tempfile.TemporaryDirectory() as td:
+        base = Path(td)
+        cache_dir = base / "cache"
+        cfg = LLMConfig(base_url="http://example.com", model="m")
+        for run_no in range(2):
+            work_dir = base / f"work{run_no}"
+            (work_dir / "pre").mkdir(parents=True)
+            (work_dir / "pre" / "000001.txt").write_text("IN\n", encoding="utf-8")
+            job_id = _mk_job(work_dir, base / "out.txt", total_chunks=2)
+            try:
+                runner._llm_worker(job_id, 1, work_dir, cfg, write_llm_resp=False, cache_dir=cache_dir)
+                st = GLOBAL_JOBS.get(job_id)
+                assert st is not None
+                assert st.chunk_statuses[1].state == "done"
+                assert (work_dir / "out" / "000001.txt").read_text(encoding="utf-8") == "OUT\n"
+                stats = dict(st.stats)
+            finally:
+                GLOBAL_JOBS.delete(job_id)
+
+        assert calls == ["IN\n"]
+        assert stats.get("llm_cache_hit_chunks") == 1
+        assert "llm_chunks" not in stats
+
+
+def test_unusable_response_cache_dir_falls_back_to_llm(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[str] = []
+
+    def fake_call(cfg: LLMConfig, input_text: str, *, should_stop=None, on_retry=None):
+        calls.append(input_text)
+        return LLMTextResult(text=input_text, raw_text="RAW"), 0, None, None
+
+    monkeypatch.setattr(runner, "call_llm_text_resilient_with_meta_and_raw", fake_call)
+
+    with tempfile.TemporaryDirectory() as td:
+        base = Path(td)
+        not_a_dir = base / "cache"
+        not_a_dir.write_text("", encoding="utf-8")
+        monkeypatch.setenv("NOVEL_PROOFER_LLM_CACHE_DIR", str(not_a_dir))
+
+        input_path = _write_input(base / "in.txt", "第1章\n\n你好\n")
+        job_id = _mk_job(base / "work", base / "out.txt", total_chunks=0)
+        try:
+            llm = LLMConfig(base_url="http://example.com", model="m", max_concurrency=1)
+            runner.run_job(job_id, input_path, runner.FormatConfig(max_chunk_chars=2000), llm)
+            runner.resume_paused_job(job_id, llm)
+            st = GLOBAL_JOBS.get(job_id)
+            assert st is not None
+            assert st.state == "paused"
+            assert st.phase == "merge"
+            assert len(calls) == 1
+            assert st.stats.get("llm_chunks") == 1
+        finally:
+            GLOBAL_JOBS.delete(job_id)
+
+
+def test_llm_worker_drops_cached_response_that_fails_validation(monkeypatch: pytest.MonkeyPatch) -> None:
+    from novel_proofer.llm.cache import load_cached_response, response_cache_key, store_cached_response
+
+    pre = "这是一段足够长的正文。" * 40
+    calls: list[str] = []
+
+    def fake_call(cfg: LLMConfig, input_text: str, *, should_stop=None, on_retry=None):
+        calls.append(input_text)
+        return LLMTextResult(text=input_text, raw_text="RAW"), 0, None, None
+
+    monkeypatch.setattr(runner, "call_llm_text_resilient_with_meta_and_raw", fake_call)
+
+    with tempfile.TemporaryDirectory() as td:
+        base = Path(td)
+        cache_dir = base / "cache"
+        cfg = LLMConfig(base_url="http://example.com", model="m")
+        key = response_cache_key(cfg, pre)
+        store_cached_response(cache_dir, key, "x")
+
+        work_dir = base / "work"
+        (work_dir / "pre").mkdir(parents=True)
+        (work_dir / "pre" / "000001.txt").write_text(pre, encoding="utf-8")
+        job_id = _mk_job(work_dir, base / "out.txt", total_chunks=2)
+        try:
+            runner._llm_worker(job_id, 1, work_dir, cfg, write_llm_resp=False, cache_dir=cache_dir)
+            st = GLOBAL_JOBS.get(job_id)
+            assert st is not None
+            assert st.chunk_statuses[1].state == "done"
+            assert st.stats.get("llm_chunks") == 1
+            assert "llm_cache_hit_chunks" not in st.stats
+        finally:
+            GLOBAL_JOBS.delete(job_id)
+
+        assert calls == [pre]
+        # The bad entry was replaced by the validated live output.
+        assert load_cached_response(cache_dir, key) == pre
@@ -8,7 +8,7 @@ import pytest
 import novel_proofer.runner as runner
 from novel_proofer.formatting.config import FormatConfig
 from novel_proofer.jobs import GLOBAL_JOBS
-from novel_proofer.llm.client import LLMTextResult
+from novel_proofer.llm.client import LLMError, LLMTextResult
 from novel_proofer.llm.config import LLMConfig
 
 
@@ -25,6 +25,34 @@ def test_run_job_missing_paths_sets_error() -> None:
         GLOBAL_JOBS.delete(job_id)
 
 
+def test_failed_job_keeps_debug_readme_even_with_cleanup(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail(cfg: LLMConfig, input_text: str, *, should_stop=None, on_retry=None):
+        raise LLMError("boom", status_code=500)
+
+    monkeypatch.setattr(runner, "call_llm_text_resilient_with_meta_and_raw", fail)
+
+    with tempfile.TemporaryDirectory() as td:
+        work_dir = Path(td) / "work"
+        input_path = Path(td) / "in.txt"
+        input_path.write_text("第1章\n\n你好\n", encoding="utf-8")
+
+        job_id = GLOBAL_JOBS.create("in.txt", "out.txt", total_chunks=0).job_id
+        try:
+            GLOBAL_JOBS.update(job_id, work_dir=str(work_dir), output_path=str(Path(td) / "out.txt"))
+            llm = LLMConfig(base_url="http://example.com", model="m", max_concurrency=1)
+            runner.run_job(job_id, input_path, FormatConfig(max_chunk_chars=2000), llm)
+            assert not (work_dir / "README.txt").exists()
+
+            # The job never reaches the merge cleanup, so the work dir stays and gets its README.
+            runner.resume_paused_job(job_id, llm)
+            st = GLOBAL_JOBS.get(job_id)
+            assert st is not None
+            assert st.state == "error"
+            assert (work_dir / "README.txt").exists()
+        finally:
+            GLOBAL_JOBS.delete(job_id)
+
+
 def test_run_job_local_mode_cleans_up_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
         runner,
@@ -59,6 +87,8 @@ def test_run_job_local_mode_cleans_up_by_default(monkeypatch: pytest.MonkeyPatch
             assert st1 is not None
             assert st1.state == "paused"
             assert getattr(st1, "phase", None) == "process"
+            # Debug README is skipped when the work dir is going to be removed anyway.
+            assert not (work_dir / "README.txt").exists()
 
             runner.resume_paused_job(job_id, LLMConfig(base_url="http://example.com", model="m", max_concurrency=1))
             st2 = GLOBAL_JOBS.get(job_id)